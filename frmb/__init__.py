@@ -3,7 +3,12 @@ __version__ = "1.0.1"
 from ._parsing import FrmbFormat
 from ._parsing import read_hierarchy_from_root
 from ._parsing import validate_entry_hierarchy
+from ._parsing import read_and_validate_hierarchy_from_root
 from ._windows import generate_reg_from_hierarchy
+from ._windows import generate_reg_shards_from_hierarchy
+from ._windows import SHARD_MODES
+from ._windows import read_hierarchy_from_reg
+from ._index import HierarchyIndex
 from ._cli import CLI
 from .__main__ import execute_cli
 
@@ -11,7 +16,12 @@ __all__ = [
     "FrmbFormat",
     "read_hierarchy_from_root",
     "validate_entry_hierarchy",
+    "read_and_validate_hierarchy_from_root",
     "generate_reg_from_hierarchy",
+    "generate_reg_shards_from_hierarchy",
+    "SHARD_MODES",
+    "read_hierarchy_from_reg",
+    "HierarchyIndex",
     "CLI",
     "execute_cli",
 ]
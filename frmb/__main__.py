@@ -1,4 +1,7 @@
 import difflib
+import glob
+import hashlib
+import json
 import logging
 import sys
 from pathlib import Path
@@ -19,7 +22,9 @@ def increment_path(path: Path) -> Path:
     """
     increment = 1
 
-    existing_versions = sorted(list(path.parent.glob(f"{path.stem}.????{path.suffix}")))
+    # the file name must not be interpreted as a glob pattern
+    pattern = f"{glob.escape(path.stem)}.????{glob.escape(path.suffix)}"
+    existing_versions = sorted(list(path.parent.glob(pattern)))
     if existing_versions:
         last_version = "".join(
             [
@@ -35,6 +40,73 @@ def increment_path(path: Path) -> Path:
     return new_path
 
 
+def write_reg_shards(
+    shards_add: dict[str, list[str]],
+    shards_remove: dict[str, list[str]],
+    target_dir: Path,
+    previous_records: dict[str, dict],
+) -> list[dict]:
+    """
+    Write each install/uninstall reg shard pair to disk as a new version, only if
+    their content changed since the previous run.
+
+    Shards are versioned like the single reg files, so the uninstall shard
+    matching a previously imported install shard is never overwritten.
+
+    Args:
+        shards_add: mapping of "shard name": "install reg file as list of line".
+        shards_remove: mapping of "shard name": "uninstall reg file as list of line".
+        target_dir: filesystem path to an existing directory.
+        previous_records: mapping of "shard name": "record from the previous manifest".
+
+    Returns:
+        list of manifest records, one per shard.
+    """
+    install_dir = target_dir / "install"
+    uninstall_dir = target_dir / "uninstall"
+    install_dir.mkdir(exist_ok=True)
+    uninstall_dir.mkdir(exist_ok=True)
+    records = []
+
+    for shard_name, reg_content_add in shards_add.items():
+        # hash the exact bytes written to disk
+        content_add = "\n".join(reg_content_add).encode("utf-8")
+        content_remove = "\n".join(shards_remove[shard_name]).encode("utf-8")
+        record = {
+            "name": shard_name,
+            "install_sha256": hashlib.sha256(content_add).hexdigest(),
+            "uninstall_sha256": hashlib.sha256(content_remove).hexdigest(),
+        }
+
+        previous = previous_records.get(shard_name, {})
+        changed = not (
+            previous.get("install_sha256") == record["install_sha256"]
+            and previous.get("uninstall_sha256") == record["uninstall_sha256"]
+            and target_dir.joinpath(previous["install"]).exists()
+            and target_dir.joinpath(previous["uninstall"]).exists()
+        )
+
+        if changed:
+            install_path = increment_path(install_dir / f"{shard_name}.reg")
+            # uninstall shard must share the version of its install shard
+            uninstall_path = uninstall_dir / install_path.name
+            LOGGER.info(f"writing {install_path}")
+            install_path.write_bytes(content_add)
+            LOGGER.info(f"writing {uninstall_path}")
+            uninstall_path.write_bytes(content_remove)
+            record["install"] = install_path.relative_to(target_dir).as_posix()
+            record["uninstall"] = uninstall_path.relative_to(target_dir).as_posix()
+        else:
+            LOGGER.debug(f"skipping unchanged shard {shard_name}")
+            record["install"] = previous["install"]
+            record["uninstall"] = previous["uninstall"]
+
+        record["changed"] = changed
+        records.append(record)
+
+    return records
+
+
 def execute_cli(argv: Sequence[str] | None = None):
     """
     Run the CLI using user-provided arguments.
@@ -65,12 +137,13 @@ def execute_cli(argv: Sequence[str] | None = None):
             f"target_dir provided doesn't exist on disk: {target_dir}"
         )
 
-    LOGGER.info(f"reading {root_dir}")
-    hierarchy = frmb.read_hierarchy_from_root(root_dir)
-
-    # // validate data read from disk
+    # // read and validate data from disk
 
-    errors, warnings = frmb.validate_entry_hierarchy(hierarchy)
+    LOGGER.info(f"reading {root_dir}")
+    hierarchy, errors, warnings = frmb.read_and_validate_hierarchy_from_root(
+        root_dir,
+        fail_fast=cli.fail_fast,
+    )
 
     sep = "\n  "
     warning_message = "\n".join(
@@ -93,6 +166,56 @@ def execute_cli(argv: Sequence[str] | None = None):
     # // generate reg file
 
     comments = [f"generated from {root_dir}"]
+
+    if cli.shard_by:
+        shards_add = frmb.generate_reg_shards_from_hierarchy(
+            hierarchy,
+            shard_by=cli.shard_by,
+            header_comments=comments,
+            add_keys=True,
+        )
+        shards_remove = frmb.generate_reg_shards_from_hierarchy(
+            hierarchy,
+            shard_by=cli.shard_by,
+            header_comments=comments,
+            add_keys=False,
+        )
+
+        # // write files to disk
+
+        target_manifest = target_dir / "manifest.json"
+        previous_records = {}
+        if target_manifest.exists():
+            previous_manifest = json.loads(target_manifest.read_text("utf-8"))
+            previous_records = {
+                record["name"]: record
+                for record in previous_manifest["shards"] + previous_manifest["removed"]
+            }
+
+        records = write_reg_shards(
+            shards_add,
+            shards_remove,
+            target_dir=target_dir,
+            previous_records=previous_records,
+        )
+        # keep track of removed shards so they can still be uninstalled
+        removed = [
+            {**record, "changed": False}
+            for shard_name, record in previous_records.items()
+            if shard_name not in shards_add
+        ]
+
+        manifest = {
+            "generator": f"{frmb.__name__} v{frmb.__version__}",
+            "root_dir": str(root_dir),
+            "shard_by": cli.shard_by,
+            "shards": records,
+            "removed": removed,
+        }
+        LOGGER.info(f"writing {target_manifest}")
+        target_manifest.write_text(json.dumps(manifest, indent=4), encoding="utf-8")
+        return
+
     reg_content_add = frmb.generate_reg_from_hierarchy(
         hierarchy,
         header_comments=comments,
@@ -38,13 +38,35 @@ class CLI:
             default="",
             help="Path to an existing directory where the reg file must be created. Default is root-dir.",
         )
+        self.parser.add_argument(
+            "--shard-by",
+            type=str,
+            choices=frmb.SHARD_MODES,
+            default="",
+            help=(
+                "Write one reg file per root entry or per registry path, instead of a "
+                "single reg file, along with a manifest.json. "
+                "A new version of a reg file is only created when its content changes."
+            ),
+        )
         self.parser.add_argument(
             "--debug",
             action="store_true",
             help="Output debug logging.",
         )
+        # those flags are contradictory: one stops at the first error while the
+        # other doesn't stop at all.
+        errors_group = self.parser.add_mutually_exclusive_group()
+        errors_group.add_argument(
+            "--fail-fast",
+            action="store_true",
+            help=(
+                "Stop reading the hierarchy at the first error found and raise. "
+                "Cannot be combined with --ignore-errors."
+            ),
+        )
         # intention for this flag are mainly for unittesting
-        self.parser.add_argument(
+        errors_group.add_argument(
             "--ignore-errors",
             action="store_true",
             help="Doesn't raise when errors are found. Use at your own risk.",
@@ -78,6 +100,20 @@ class CLI:
         """
         return Path(self.parsed.target_dir) if self.parsed.target_dir else None
 
+    @property
+    def shard_by(self) -> str | None:
+        """
+        Criteria used to split the reg files, or None to create a single reg file.
+        """
+        return self.parsed.shard_by or None
+
+    @property
+    def fail_fast(self) -> bool:
+        """
+        If True, stop (raise) at the first error found in the hierarchy.
+        """
+        return self.parsed.fail_fast
+
     @property
     def ignore_errors(self) -> bool:
         """
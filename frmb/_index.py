@@ -0,0 +1,226 @@
+import dataclasses
+import logging
+from pathlib import Path
+from typing import Iterable
+
+import frmb
+from ._windows import get_entry_key_path
+
+LOGGER = logging.getLogger(__name__)
+
+
+class HierarchyIndex:
+    """
+    Lookup tables over a hierarchy of Frmb instances, to query entries without
+    traversing the hierarchy.
+
+    Entries are indexed by the full registry key path they are stored at, which
+    means a root entry (and its children) is indexed once per registry path it
+    specifies.
+
+    Queries returning multiple entries return a new dict of
+    "full registry key path": "entry".
+
+    Args:
+        hierarchy: a list of FrmbFormat that correspond to the root entries of a context menu.
+    """
+
+    def __init__(self, hierarchy: Iterable[frmb.FrmbFormat]):
+        self._entries: dict[str, frmb.FrmbFormat] = {}
+        # "full registry key path": "registry path of the root entry"
+        self._registry_paths: dict[str, str] = {}
+
+        self._by_identifier: dict[str, dict[str, frmb.FrmbFormat]] = {}
+        self._by_icon: dict[Path, dict[str, frmb.FrmbFormat]] = {}
+        self._by_executable: dict[str, dict[str, frmb.FrmbFormat]] = {}
+        self._by_registry_path: dict[str, dict[str, frmb.FrmbFormat]] = {}
+
+        for root_entry in hierarchy:
+            for registry_path in root_entry.paths:
+                self._add_entry(
+                    root_entry,
+                    parent_path=registry_path,
+                    registry_path=registry_path,
+                )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key_path: str) -> bool:
+        return key_path in self._entries
+
+    def _get_tables(self, key_path: str, entry: frmb.FrmbFormat):
+        """
+        Get the lookup tables the given entry is stored in, with the key it uses in each.
+        """
+        tables = [
+            (self._by_identifier, entry.identifier),
+            (self._by_registry_path, self._registry_paths[key_path]),
+        ]
+        if entry.icon:
+            tables.append((self._by_icon, entry.icon))
+        if entry.command:
+            tables.append((self._by_executable, entry.command[0]))
+        return tables
+
+    def _register(self, key_path: str, entry: frmb.FrmbFormat, registry_path: str):
+        """
+        Add the given entry in all the lookup tables, without its children.
+        """
+        self._entries[key_path] = entry
+        self._registry_paths[key_path] = registry_path
+        for table, table_key in self._get_tables(key_path, entry):
+            table.setdefault(table_key, {})[key_path] = entry
+
+    def _unregister(self, key_path: str):
+        """
+        Remove the entry at the given key from all the lookup tables, without its children.
+        """
+        entry = self._entries[key_path]
+        for table, table_key in self._get_tables(key_path, entry):
+            entries = table[table_key]
+            del entries[key_path]
+            if not entries:
+                del table[table_key]
+        del self._entries[key_path]
+        del self._registry_paths[key_path]
+
+    def _add_entry(self, entry: frmb.FrmbFormat, parent_path: str, registry_path: str):
+        key_path = get_entry_key_path(entry, parent_path=parent_path)
+        self._register(key_path, entry, registry_path=registry_path)
+        for child in entry.children:
+            self._add_entry(child, parent_path=key_path, registry_path=registry_path)
+
+    def _remove_entry(self, key_path: str):
+        entry = self._entries[key_path]
+        for child in entry.children:
+            self._remove_entry(get_entry_key_path(child, parent_path=key_path))
+        self._unregister(key_path)
+
+    def get_entry(self, key_path: str) -> frmb.FrmbFormat | None:
+        """
+        Get the entry that produces the given registry key.
+
+        Args:
+            key_path:
+                full registry key path of an entry, or of the ``command`` key of an entry.
+
+        Returns:
+            entry found or None if no entry produces this key.
+        """
+        entry = self._entries.get(key_path)
+        if entry is None and key_path.endswith("\\command"):
+            entry = self._entries.get(key_path[: -len("\\command")])
+        return entry
+
+    def get_entries_by_identifier(self, identifier: str) -> dict[str, frmb.FrmbFormat]:
+        """
+        Get all the entries with the given identifier.
+        """
+        return dict(self._by_identifier.get(identifier, {}))
+
+    def get_entries_by_icon(self, icon: Path) -> dict[str, frmb.FrmbFormat]:
+        """
+        Get all the entries using the given icon path.
+        """
+        return dict(self._by_icon.get(icon, {}))
+
+    def get_entries_by_executable(self, executable: str) -> dict[str, frmb.FrmbFormat]:
+        """
+        Get all the entries whose command starts with the given executable.
+        """
+        return dict(self._by_executable.get(executable, {}))
+
+    def get_entries_by_registry_path(
+        self,
+        registry_path: str,
+    ) -> dict[str, frmb.FrmbFormat]:
+        """
+        Get all the entries, at any depth, stored under the given root registry path.
+        """
+        return dict(self._by_registry_path.get(registry_path, {}))
+
+    def replace_entry(self, key_path: str, entry: frmb.FrmbFormat) -> str:
+        """
+        Replace the entry at the given registry key, and all its children, by the given entry.
+
+        As a root entry has the same children for all its registry paths, the
+        entry is replaced under every registry path of its root entry.
+
+        When replacing a root entry, the new entry must specify the same ``paths``:
+        changing the registry paths of a root entry is not supported.
+
+        Only the lookup tables of the replaced subtrees are updated. The parent
+        entries of the given key are updated to refer to the new entry.
+
+        Args:
+            key_path: full registry key path of an existing entry.
+            entry: new entry to store instead, can have a different identifier.
+
+        Raises:
+            KeyError: if no entry is indexed at the given key.
+            ValueError:
+                if the new identifier is already used by another entry under any
+                registry path, or if a root entry is replaced with different paths.
+
+        Returns:
+            full registry key path of the new entry, under the registry path of the given key.
+        """
+        if key_path not in self._entries:
+            raise KeyError(f"No entry indexed at {key_path}")
+
+        old_entry = self._entries[key_path]
+        registry_path = self._registry_paths[key_path]
+        parent_path = key_path[: -len(f"\\shell\\{old_entry.identifier}")]
+        new_key_path = get_entry_key_path(entry, parent_path=parent_path)
+
+        # rebuild the parents, which are immutable, to refer to the new entry
+        # as: ["key path relative to the registry path", "old entry", "new entry"]
+        chain = [(key_path[len(registry_path) :], old_entry, entry)]
+        while parent_path in self._entries:
+            parent_old = self._entries[parent_path]
+            _, child_old, child_new = chain[-1]
+            children = tuple(
+                child_new if child is child_old else child
+                for child in parent_old.children
+            )
+            parent_new = dataclasses.replace(parent_old, children=children)
+            chain.append((parent_path[len(registry_path) :], parent_old, parent_new))
+            parent_path = parent_path[: -len(f"\\shell\\{parent_old.identifier}")]
+
+        root_entry = chain[-1][1]
+        old_path = chain[0][0]
+        new_path = new_key_path[len(registry_path) :]
+
+        if root_entry is old_entry and entry.paths != old_entry.paths:
+            raise ValueError(
+                f"Cannot replace root entry {old_entry} by {entry}: "
+                f"paths {entry.paths} are different from {old_entry.paths}"
+            )
+
+        # check all registry paths before modifying anything
+        if new_path != old_path:
+            for root_registry_path in root_entry.paths:
+                if root_registry_path + new_path in self._entries:
+                    raise ValueError(
+                        f"Cannot replace {old_entry} by {entry}: an entry "
+                        f"already exists at {root_registry_path + new_path}"
+                    )
+
+        for root_registry_path in root_entry.paths:
+            old_key_path = root_registry_path + old_path
+            self._remove_entry(old_key_path)
+            self._add_entry(
+                entry,
+                parent_path=old_key_path[: -len(f"\\shell\\{old_entry.identifier}")],
+                registry_path=root_registry_path,
+            )
+            for relative_path, _, parent_new in chain[1:]:
+                parent_key_path = root_registry_path + relative_path
+                self._unregister(parent_key_path)
+                self._register(
+                    parent_key_path, parent_new, registry_path=root_registry_path
+                )
+
+        LOGGER.debug(f"replaced {old_entry} at {key_path} by {entry}")
+        return new_key_path
@@ -139,6 +139,54 @@ def read_hierarchy_from_root(root_dir: Path) -> list[FrmbFormat]:
     return output
 
 
+MAX_NESTED_ENTRIES = 16
+"""
+Maximum number of nested entries Windows supports for a single root entry.
+"""
+
+
+def _validate_entry(
+    entry: FrmbFormat,
+    child_number: int,
+) -> tuple[list[str], list[str]]:
+    """
+    Return issues the given entry has, without considering its children.
+
+    Args:
+        entry: entry to validate
+        child_number: number of nested entry we currently have for a root entry, 0 for root entries.
+
+    Returns:
+        tuple of errors, warnings
+    """
+    errors = []
+    warnings = []
+
+    if child_number > MAX_NESTED_ENTRIES:
+        errors.append(
+            f"maximum number of {MAX_NESTED_ENTRIES} nested entry reached with {entry}"
+        )
+
+    if not child_number and not entry.paths:
+        errors.append(f"no paths specified for root entry {entry}")
+
+    if entry.icon and os.sep in str(entry.icon) and not entry.icon.is_file():
+        warnings.append(
+            f"icon path doesn't exist on disk: got {entry.icon}, expected to be an existing file."
+        )
+
+    return errors, warnings
+
+
+def _validate_entry_children(entry: FrmbFormat) -> list[str]:
+    """
+    Return warnings about the children the given entry has.
+    """
+    if entry.children and entry.command:
+        return [f"Entry {entry} is specifying both a command and children."]
+    return []
+
+
 def validate_entry_hierarchy(
     hierarchy: Iterable[FrmbFormat],
     __child_number: int = 0,
@@ -163,25 +211,13 @@ def validate_entry_hierarchy(
         if __child_number:
             __child_number += 1
 
-        if __child_number > 16:
-            errors.setdefault(entry, []).append(
-                f"maximum number of 16 nested entry reached with {entry}"
-            )
-
-        if not __child_number and not entry.paths:
-            errors.setdefault(entry, []).append(
-                f"no paths specified for root entry {entry}"
-            )
+        entry_errors, entry_warnings = _validate_entry(entry, __child_number)
+        entry_warnings = _validate_entry_children(entry) + entry_warnings
 
-        if entry.children and entry.command:
-            warnings.setdefault(entry, []).append(
-                f"Entry {entry} is specifying both a command and children."
-            )
-
-        if entry.icon and os.sep in str(entry.icon) and not entry.icon.is_file():
-            warnings.setdefault(entry, []).append(
-                f"icon path doesn't exist on disk: got {entry.icon}, expected to be an existing file."
-            )
+        if entry_errors:
+            errors.setdefault(entry, []).extend(entry_errors)
+        if entry_warnings:
+            warnings.setdefault(entry, []).extend(entry_warnings)
 
         child_errors, child_warnings = validate_entry_hierarchy(
             entry.children,
@@ -191,3 +227,107 @@ def validate_entry_hierarchy(
         warnings.update(child_warnings)
 
     return errors, warnings
+
+
+def _read_and_validate_directory(
+    directory: Path,
+    child_number: int,
+    errors: dict[FrmbFormat | Path, list[str]],
+    warnings: dict[FrmbFormat | Path, list[str]],
+    fail_fast: bool,
+) -> list[FrmbFormat]:
+    """
+    Recursive implementation of :func:`read_and_validate_hierarchy_from_root`.
+
+    Issues are added to the given ``errors`` and ``warnings`` dict.
+
+    The ``child_number`` is counted the same way as :func:`validate_entry_hierarchy`.
+    """
+    output: list[FrmbFormat] = []
+
+    for frmb_path in directory.glob("*.frmb"):
+
+        if child_number:
+            child_number += 1
+
+        try:
+            frmb_obj = FrmbFormat.from_file(frmb_path, root_dir=directory)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as error:
+            message = f"cannot parse file: {error.__class__.__name__}: {error}"
+            errors.setdefault(frmb_path, []).append(message)
+            if fail_fast:
+                break
+            frmb_dir = frmb_path.with_suffix("")
+            if frmb_dir.is_dir():
+                warnings.setdefault(frmb_dir, []).append(
+                    f"children entries not read as their parent {frmb_path} cannot be parsed."
+                )
+            continue
+
+        # validate as soon as possible, before reading the children
+        if fail_fast:
+            entry_errors, _ = _validate_entry(frmb_obj, child_number)
+            if entry_errors:
+                errors[frmb_obj] = entry_errors
+                break
+
+        frmb_dir = frmb_path.with_suffix("")
+        if frmb_dir.is_dir():
+            children = _read_and_validate_directory(
+                frmb_dir,
+                child_number=child_number if child_number else 1,
+                errors=errors,
+                warnings=warnings,
+                fail_fast=fail_fast,
+            )
+            frmb_obj = dataclasses.replace(frmb_obj, children=tuple(children))
+            if errors and fail_fast:
+                break
+
+        # issues messages include the entry's children so validate the final entry
+        entry_errors, entry_warnings = _validate_entry(frmb_obj, child_number)
+        entry_warnings = _validate_entry_children(frmb_obj) + entry_warnings
+        if entry_errors:
+            errors[frmb_obj] = entry_errors
+        if entry_warnings:
+            warnings[frmb_obj] = entry_warnings
+
+        output.append(frmb_obj)
+
+    return output
+
+
+def read_and_validate_hierarchy_from_root(
+    root_dir: Path,
+    fail_fast: bool = False,
+) -> tuple[
+    list[FrmbFormat],
+    dict[FrmbFormat | Path, list[str]],
+    dict[FrmbFormat | Path, list[str]],
+]:
+    """
+    Combine :func:`read_hierarchy_from_root` and :func:`validate_entry_hierarchy`
+    in a single pass, where each entry is validated as soon as it is read.
+
+    Files that cannot be parsed are reported as errors, using their path as key,
+    and are excluded from the returned hierarchy.
+
+    Args:
+        root_dir: directory reprensenting the start of the context-menu entries hierarchy.
+        fail_fast:
+            if True, stop reading the hierarchy at the first error found.
+            The returned hierarchy is then incomplete.
+
+    Returns:
+        tuple of hierarchy, errors["frmb instance or path", "list of errors"], warnings["frmb instance or path", "list of warnings"]
+    """
+    errors = {}
+    warnings = {}
+    hierarchy = _read_and_validate_directory(
+        root_dir,
+        child_number=0,
+        errors=errors,
+        warnings=warnings,
+        fail_fast=fail_fast,
+    )
+    return hierarchy, errors, warnings
@@ -1,4 +1,7 @@
+import dataclasses
+import hashlib
 import logging
+import re
 import subprocess
 from pathlib import Path
 from typing import Iterable
@@ -7,6 +10,9 @@ import frmb
 
 LOGGER = logging.getLogger(__name__)
 
+# (backslashes preceding a quote, quote), whitespaces, any other characters
+_COMMAND_TOKEN_PATTERN = re.compile(r'(\\*)(")|([ \t]+)|([^ \t"\\]+|\\+)')
+
 
 def escape_windows_path(path: Path) -> str:
     return str(path).replace("\\", "\\\\")
@@ -16,6 +22,69 @@ def escape_windows_command(command: Iterable[str]) -> str:
     return subprocess.list2cmdline(command)
 
 
+def unescape_windows_path(path: str) -> Path:
+    """
+    Inverse of :func:`escape_windows_path`.
+    """
+    return Path(path.replace("\\\\", "\\"))
+
+
+def unescape_windows_command(command: str) -> tuple[str, ...]:
+    """
+    Inverse of :func:`escape_windows_command`.
+
+    Split a command line string to a list of arguments using the same rules as
+    the MS C runtime (which ``subprocess.list2cmdline`` follows).
+    """
+    if '"' not in command:
+        # backslashes are only special when preceding a quote
+        command = command.strip(" \t")
+        return tuple(re.split(r"[ \t]+", command)) if command else tuple()
+
+    arguments = []
+    buffer = []
+    in_argument = False
+    in_quotes = False
+
+    for match in _COMMAND_TOKEN_PATTERN.finditer(command):
+        backslashes, quote, whitespace, text = match.groups()
+
+        if whitespace is not None and not in_quotes:
+            if in_argument:
+                arguments.append("".join(buffer))
+                buffer = []
+                in_argument = False
+            continue
+
+        in_argument = True
+
+        if quote is None:
+            buffer.append(text if whitespace is None else whitespace)
+            continue
+
+        buffer.append("\\" * (len(backslashes) // 2))
+        if len(backslashes) % 2:
+            buffer.append('"')
+        else:
+            in_quotes = not in_quotes
+
+    if in_argument:
+        arguments.append("".join(buffer))
+
+    return tuple(arguments)
+
+
+def get_entry_key_path(entry: frmb.FrmbFormat, parent_path: str) -> str:
+    """
+    Get the full registry key path the given entry is stored at.
+
+    Args:
+        entry: entry to get the key path of.
+        parent_path: registry path of the root entry, or key path of the parent entry.
+    """
+    return f"{parent_path}\\shell\\{entry.identifier}"
+
+
 def _generate_reg_from_entry(
     entry: frmb.FrmbFormat,
     parent_path: str,
@@ -28,7 +97,7 @@ def _generate_reg_from_entry(
     """
     output = []
     path_prefix = "" if add_keys else "-"
-    full_path = f"{parent_path}\\shell\\{entry.identifier}"
+    full_path = get_entry_key_path(entry, parent_path=parent_path)
 
     if entry.children:
         output += [f"; {entry.name}"]
@@ -99,3 +168,209 @@ def generate_reg_from_hierarchy(
             )
 
     return output
+
+
+SHARD_MODES = ("entry", "path")
+"""
+Available criteria to split a hierarchy into multiple reg files.
+"""
+
+
+def get_shard_name(registry_path: str) -> str:
+    """
+    Convert a registry path to a string that can safely be used as a file name.
+
+    Invalid file name and glob characters are replaced by ``_`` and a short hash of the
+    original path is appended to avoid collisions.
+    """
+    path_hash = hashlib.sha1(registry_path.encode("utf-8")).hexdigest()[:8]
+    name = re.sub(r'[\\/:*?"<>|\[\]]', "_", registry_path)
+    return f"{name}-{path_hash}"
+
+
+def generate_reg_shards_from_hierarchy(
+    hierachy: list[frmb.FrmbFormat],
+    shard_by: str = "entry",
+    header_comments: list[str] | None = None,
+    add_keys: bool = True,
+) -> dict[str, list[str]]:
+    """
+    Generate multiple valid reg files from the given hierarchy of Frmb instances.
+
+    Each reg file ("shard") can be imported independently of the others.
+
+    Args:
+        hierachy:
+            content of the reg files as list of root keys.
+        shard_by:
+            one of :obj:`SHARD_MODES`. ``entry`` creates one reg file per root
+            entry, ``path`` creates one reg file per registry path.
+        header_comments:
+            list of line that should be added in the header comment section of each shard
+        add_keys:
+            True to create reg files to install, False to create the inverse that uninstall.
+
+    Returns:
+        mapping of "shard name": "reg file as a list of line", where the shard
+        name can be used as a file name.
+    """
+    if shard_by not in SHARD_MODES:
+        raise ValueError(
+            f"Unsupported shard_by value {shard_by!r}: expected one of {SHARD_MODES}"
+        )
+
+    shards: dict[str, list[frmb.FrmbFormat]] = {}
+
+    for root_entry in hierachy:
+        if shard_by == "entry":
+            shards.setdefault(root_entry.identifier, []).append(root_entry)
+            continue
+
+        for registry_path in root_entry.paths:
+            shards.setdefault(get_shard_name(registry_path), []).append(
+                dataclasses.replace(root_entry, paths=(registry_path,))
+            )
+
+    return {
+        shard_name: generate_reg_from_hierarchy(
+            shard_entries,
+            header_comments=header_comments,
+            add_keys=add_keys,
+        )
+        for shard_name, shard_entries in shards.items()
+    }
+
+
+@dataclasses.dataclass
+class _RegEntryBuilder:
+    """
+    Mutable intermediate of a :class:`FrmbFormat` while a reg file is being parsed.
+    """
+
+    name: str = ""
+    identifier: str = ""
+    icon: Path | None = None
+    command: tuple[str, ...] = tuple()
+    children: list["_RegEntryBuilder"] = dataclasses.field(default_factory=list)
+
+    def build(self, paths: tuple[str, ...] = tuple()) -> frmb.FrmbFormat:
+        return frmb.FrmbFormat(
+            name=self.name,
+            identifier=self.identifier,
+            icon=self.icon,
+            command=self.command,
+            paths=paths,
+            children=tuple(child.build() for child in self.children),
+        )
+
+
+def _unquote_reg_value(value: str) -> str:
+    if len(value) >= 2 and value.startswith('"') and value.endswith('"'):
+        return value[1:-1]
+    return value
+
+
+def _add_root_entry(output: list[frmb.FrmbFormat], root_entry: frmb.FrmbFormat):
+    """
+    Append the given root entry to the given list, or merge its paths with the
+    last entry of the list if they are the same.
+    """
+    previous = output[-1] if output else None
+    if previous and previous == dataclasses.replace(root_entry, paths=previous.paths):
+        output[-1] = dataclasses.replace(
+            previous,
+            paths=previous.paths + root_entry.paths,
+        )
+    else:
+        output.append(root_entry)
+
+
+def read_hierarchy_from_reg(reg_lines: Iterable[str]) -> list[frmb.FrmbFormat]:
+    """
+    Rebuild a hierarchy of Frmb instances from the lines of a reg file.
+
+    This is the inverse of :func:`generate_reg_from_hierarchy` and accepts
+    both the "install" and "uninstall" variants of the reg file.
+
+    Lines are consumed one by one in a single pass so an opened file object can
+    be passed directly, without loading the whole file in memory first. Only the
+    keys of the root entry being read are kept in memory.
+
+    Root entries that are written consecutively for multiple registry paths
+    are merged back to a single instance with all the paths.
+
+    Args:
+        reg_lines: content of the reg file as an iterable of lines, line endings are ignored.
+
+    Returns:
+        list of root entries found in the reg file.
+    """
+    output: list[frmb.FrmbFormat] = []
+    # keys of the root entry being read, children always follow their root
+    entries_by_key: dict[str, _RegEntryBuilder] = {}
+    root_builder: _RegEntryBuilder | None = None
+    root_registry_path = ""
+    current: _RegEntryBuilder | None = None
+    # True if the current key is the "command" key of an entry
+    in_command = False
+
+    for line in reg_lines:
+        line = line.rstrip("\r\n")
+
+        if not line or line.startswith(";"):
+            continue
+
+        if line.startswith("[") and line.endswith("]"):
+            key = line[1:-1].lstrip("-")
+            current = None
+            in_command = False
+
+            parent_key, _, leaf = key.rpartition("\\")
+            if leaf == "command" and parent_key in entries_by_key:
+                current = entries_by_key[parent_key]
+                in_command = True
+                continue
+
+            parent_key, sep, identifier = key.rpartition("\\shell\\")
+            if not sep:
+                LOGGER.debug(f"ignoring unsupported key {key}")
+                continue
+
+            current = _RegEntryBuilder(identifier=identifier)
+            parent = entries_by_key.get(parent_key)
+            if parent is not None:
+                parent.children.append(current)
+            else:
+                if root_builder is not None:
+                    _add_root_entry(
+                        output, root_builder.build(paths=(root_registry_path,))
+                    )
+                entries_by_key.clear()
+                root_builder = current
+                root_registry_path = parent_key
+
+            entries_by_key[key] = current
+            continue
+
+        if current is None:
+            continue
+
+        name, sep, value = line.partition("=")
+        if not sep:
+            continue
+        # registry value names are case-insensitive
+        name = name.lower()
+        value = _unquote_reg_value(value)
+
+        if in_command:
+            if name == "@":
+                current.command = unescape_windows_command(value)
+        elif name == '"muiverb"':
+            current.name = value
+        elif name == '"icon"':
+            current.icon = unescape_windows_path(value) if value else None
+
+    if root_builder is not None:
+        _add_root_entry(output, root_builder.build(paths=(root_registry_path,)))
+
+    return output
@@ -0,0 +1,158 @@
+from pathlib import Path
+
+import pytest
+
+from frmb import read_hierarchy_from_root
+from frmb._index import HierarchyIndex
+from frmb._parsing import FrmbFormat
+
+
+def test__HierarchyIndex(data_dir):
+    structure1_dir = data_dir / "structure1"
+    structure1_studio_dir = structure1_dir / "studio"
+    hierarchy = read_hierarchy_from_root(structure1_studio_dir)
+
+    index = HierarchyIndex(hierarchy)
+    # FFMPEG: 4 paths * 5 entries, OIIO Tool: 1 path * 2 entries
+    assert len(index) == 22
+
+    ffmpeg_key = "HKEY_CURRENT_USER\\Software\\Classes\\SystemFileAssociations\\.mov\\shell\\FFMPEG"
+    ffmpeg_entry = index.get_entry(ffmpeg_key)
+    assert ffmpeg_entry.name == "Ffmpeg"
+    assert ffmpeg_key in index
+
+    child_key = f"{ffmpeg_key}\\shell\\video-to-gif-interactive"
+    assert index.get_entry(child_key).identifier == "video-to-gif-interactive"
+    assert index.get_entry(f"{child_key}\\command") == index.get_entry(child_key)
+    assert index.get_entry(f"{ffmpeg_key}\\shell\\nope") is None
+
+    result = index.get_entries_by_identifier("video-to-gif-interactive")
+    assert len(result) == 4
+
+    result = index.get_entries_by_icon(Path("oiiotool.ico"))
+    assert list(result.values()) == [
+        entry for entry in hierarchy if entry.identifier == "OIIO Tool"
+    ]
+
+    result = index.get_entries_by_executable("cmd")
+    assert len(result) == 4 * 3 + 1
+
+    result = index.get_entries_by_registry_path(
+        "HKEY_CURRENT_USER\\Software\\Classes\\*"
+    )
+    assert sorted(entry.identifier for entry in result.values()) == [
+        "OIIO Tool",
+        "display-info",
+    ]
+
+
+def test__HierarchyIndex__replace_entry(data_dir):
+    structure1_dir = data_dir / "structure1"
+    structure1_studio_dir = structure1_dir / "studio"
+    hierarchy = read_hierarchy_from_root(structure1_studio_dir)
+    index = HierarchyIndex(hierarchy)
+
+    ffmpeg_key = "HKEY_CURRENT_USER\\Software\\Classes\\SystemFileAssociations\\.mov\\shell\\FFMPEG"
+    presets_key = f"{ffmpeg_key}\\shell\\video-to-gif-presets"
+    new_entry = FrmbFormat(
+        name="new",
+        identifier="new-presets",
+        icon=Path("new.ico"),
+        command=("python", "-m", "togif"),
+        paths=tuple(),
+        children=tuple(),
+    )
+
+    new_key = index.replace_entry(presets_key, new_entry)
+    assert new_key == f"{ffmpeg_key}\\shell\\new-presets"
+    # replaced under the 4 registry paths of the root entry
+    assert len(index) == 22 - 4 * 3 + 4
+    assert presets_key not in index
+    assert index.get_entry(new_key) is new_entry
+    assert not index.get_entries_by_identifier("fps_50-size_1-dithering_sierra2_4a")
+    assert not index.get_entries_by_identifier("video-to-gif-presets")
+    assert len(index.get_entries_by_identifier("new-presets")) == 4
+    assert len(index.get_entries_by_icon(Path("new.ico"))) == 4
+    assert len(index.get_entries_by_executable("python")) == 4
+
+    # parents must refer to the new entry, under all registry paths
+    ffmpeg_entries = index.get_entries_by_identifier("FFMPEG")
+    assert len(ffmpeg_entries) == 4
+    ffmpeg_entry = index.get_entry(ffmpeg_key)
+    assert all(entry is ffmpeg_entry for entry in ffmpeg_entries.values())
+    assert new_entry in ffmpeg_entry.children
+    assert len(ffmpeg_entry.children) == 2
+
+    # an index built from scratch must match
+    other_index = HierarchyIndex([ffmpeg_entry])
+    for registry_path in ffmpeg_entry.paths:
+        result = other_index.get_entries_by_registry_path(registry_path)
+        assert result == index.get_entries_by_registry_path(registry_path)
+
+    with pytest.raises(KeyError):
+        index.replace_entry(presets_key, new_entry)
+
+
+def test__HierarchyIndex__replace_entry__conflict():
+    root_entry = FrmbFormat(
+        name="r",
+        identifier="r",
+        icon=None,
+        command=tuple(),
+        paths=("P",),
+        children=(
+            FrmbFormat("a", "a", None, ("x",), tuple(), tuple()),
+            FrmbFormat("b", "b", None, ("y",), tuple(), tuple()),
+        ),
+    )
+    index = HierarchyIndex([root_entry])
+
+    new_entry = FrmbFormat("new b", "b", None, ("z",), tuple(), tuple())
+    with pytest.raises(ValueError):
+        index.replace_entry("P\\shell\\r\\shell\\a", new_entry)
+
+    assert len(index) == 3
+    assert index.get_entry("P\\shell\\r") is root_entry
+    assert index.get_entry("P\\shell\\r\\shell\\a").command == ("x",)
+    assert len(index.get_entries_by_executable("y")) == 1
+    assert not index.get_entries_by_executable("z")
+
+    # keeping the same identifier is allowed
+    new_entry = FrmbFormat("new b", "b", None, ("z",), tuple(), tuple())
+    index.replace_entry("P\\shell\\r\\shell\\b", new_entry)
+    assert not index.get_entries_by_executable("y")
+    assert index.get_entry("P\\shell\\r").children[1] is new_entry
+
+
+def test__HierarchyIndex__replace_entry__conflict_other_path():
+    root_a = FrmbFormat("a", "a", None, ("x",), ("P", "Q"), tuple())
+    root_b = FrmbFormat("b", "b", None, ("y",), ("Q",), tuple())
+    index = HierarchyIndex([root_a, root_b])
+    assert len(index) == 3
+
+    new_entry = FrmbFormat("new b", "b", None, ("z",), ("P", "Q"), tuple())
+    with pytest.raises(ValueError):
+        index.replace_entry("P\\shell\\a", new_entry)
+
+    assert len(index) == 3
+    assert index.get_entry("P\\shell\\a") is root_a
+    assert index.get_entry("Q\\shell\\b") is root_b
+    assert len(index.get_entries_by_executable("y")) == 1
+    assert not index.get_entries_by_executable("z")
+
+
+def test__HierarchyIndex__replace_entry__root():
+    root_a = FrmbFormat("a", "a", None, ("x",), ("P", "Q"), tuple())
+    index = HierarchyIndex([root_a])
+
+    new_entry = FrmbFormat("new a", "a", None, ("z",), ("R",), tuple())
+    with pytest.raises(ValueError):
+        index.replace_entry("P\\shell\\a", new_entry)
+    assert index.get_entry("P\\shell\\a") is root_a
+
+    new_entry = FrmbFormat("new a", "new-a", None, ("z",), ("P", "Q"), tuple())
+    new_key = index.replace_entry("P\\shell\\a", new_entry)
+    assert new_key == "P\\shell\\new-a"
+    assert len(index) == 2
+    assert index.get_entry("Q\\shell\\new-a") is new_entry
+    assert not index.get_entries_by_identifier("a")
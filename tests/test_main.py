@@ -1,3 +1,6 @@
+import hashlib
+import json
+
 import pytest
 
 from frmb.__main__ import execute_cli
@@ -65,3 +68,106 @@ def test__increment_path__2(tmp_path):
     expected = tmp_path / "file.0013.txt"
     result = increment_path(src_path)
     assert result == expected
+
+
+def test__main__shard_by(tmp_path, data_dir):
+    structure1_dir = data_dir / "structure1"
+    structure1_studio_dir = structure1_dir / "studio"
+
+    arguments = [
+        str(structure1_studio_dir),
+        "--target-dir",
+        str(tmp_path),
+        "--ignore-errors",
+        "--shard-by",
+        "entry",
+    ]
+    execute_cli(argv=arguments)
+
+    manifest = json.loads(tmp_path.joinpath("manifest.json").read_text("utf-8"))
+    assert manifest["shard_by"] == "entry"
+    assert len(manifest["shards"]) == 2
+    assert all(record["changed"] for record in manifest["shards"])
+    assert tmp_path.joinpath("install", "FFMPEG.0001.reg").exists()
+    assert tmp_path.joinpath("uninstall", "OIIO Tool.0001.reg").exists()
+    assert not tmp_path.joinpath("install.0001.reg").exists()
+
+    for record in manifest["shards"]:
+        content = tmp_path.joinpath(record["install"]).read_bytes()
+        assert hashlib.sha256(content).hexdigest() == record["install_sha256"]
+
+    # simulate a change in the hierarchy
+    for record in manifest["shards"]:
+        if record["name"] == "FFMPEG":
+            record["uninstall_sha256"] = "outdated"
+    tmp_path.joinpath("manifest.json").write_text(json.dumps(manifest), "utf-8")
+
+    execute_cli(argv=arguments)
+
+    manifest = json.loads(tmp_path.joinpath("manifest.json").read_text("utf-8"))
+    changed = [record["name"] for record in manifest["shards"] if record["changed"]]
+    assert changed == ["FFMPEG"]
+    # previous version must be preserved to uninstall
+    assert tmp_path.joinpath("uninstall", "FFMPEG.0001.reg").exists()
+    assert tmp_path.joinpath("uninstall", "FFMPEG.0002.reg").exists()
+    assert not tmp_path.joinpath("install", "OIIO Tool.0002.reg").exists()
+
+    # simulate a root entry removed from the hierarchy
+    manifest["shards"].append(dict(manifest["shards"][0], name="removed"))
+    tmp_path.joinpath("manifest.json").write_text(json.dumps(manifest), "utf-8")
+
+    execute_cli(argv=arguments)
+
+    manifest = json.loads(tmp_path.joinpath("manifest.json").read_text("utf-8"))
+    assert not any(record["changed"] for record in manifest["shards"])
+    assert [record["name"] for record in manifest["removed"]] == ["removed"]
+
+
+def test__main__fail_fast(tmp_path, data_dir):
+    structure1_dir = data_dir / "structure1"
+    structure1_show_dir = structure1_dir / "show"
+
+    arguments = [
+        str(structure1_show_dir),
+        "--target-dir",
+        str(tmp_path),
+        "--fail-fast",
+    ]
+    with pytest.raises(RuntimeError):
+        execute_cli(argv=arguments)
+
+    assert not tmp_path.joinpath("install.0001.reg").exists()
+
+    with pytest.raises(SystemExit):
+        execute_cli(argv=arguments + ["--ignore-errors"])
+
+
+def test__increment_path__glob_characters(tmp_path):
+    src_path = tmp_path / "tool [beta].reg"
+    tmp_path.joinpath("tool [beta].0001.reg").write_text("beaufort")
+
+    expected = tmp_path / "tool [beta].0002.reg"
+    result = increment_path(src_path)
+    assert result == expected
+
+
+def test__main__shard_by__glob_characters(tmp_path):
+    root_dir = tmp_path / "root"
+    root_dir.mkdir()
+    target_dir = tmp_path / "target"
+    target_dir.mkdir()
+    frmb_path = root_dir / "tool [beta].frmb"
+    frmb_path.write_text('{"name": "tool", "paths": ["p"], "command": ["v1"]}')
+
+    arguments = [str(root_dir), "--target-dir", str(target_dir), "--shard-by", "entry"]
+    execute_cli(argv=arguments)
+    uninstall_v1 = target_dir.joinpath("uninstall", "tool [beta].0001.reg")
+    uninstall_v1_content = uninstall_v1.read_text("utf-8")
+
+    frmb_path.write_text('{"name": "tool v2", "paths": ["p"], "command": ["v2"]}')
+    execute_cli(argv=arguments)
+
+    # previous version must be preserved to uninstall
+    assert uninstall_v1.read_text("utf-8") == uninstall_v1_content
+    assert target_dir.joinpath("install", "tool [beta].0002.reg").exists()
+    assert target_dir.joinpath("uninstall", "tool [beta].0002.reg").exists()
@@ -2,6 +2,7 @@ from pathlib import Path
 
 from frmb._parsing import FrmbFormat
 from frmb._parsing import read_hierarchy_from_root
+from frmb._parsing import read_and_validate_hierarchy_from_root
 from frmb._parsing import validate_entry_hierarchy
 from frmb._parsing import resolve_tokens
 
@@ -94,3 +95,81 @@ def test__resolve_tokens():
     tokens = {"DIR": "/d/dir", "foo": "45"}
     result = resolve_tokens(source, **tokens)
     assert result == expected
+
+
+def test__read_and_validate_hierarchy_from_root__studio(data_dir):
+    structure1_dir = data_dir / "structure1"
+    structure1_studio_dir = structure1_dir / "studio"
+
+    expected_hierarchy = read_hierarchy_from_root(structure1_studio_dir)
+    expected_errors, expected_warnings = validate_entry_hierarchy(expected_hierarchy)
+
+    result = read_and_validate_hierarchy_from_root(structure1_studio_dir)
+    hierarchy, errors, warnings = result
+    assert sorted(hierarchy, key=str) == sorted(expected_hierarchy, key=str)
+    assert errors == expected_errors
+    assert warnings == expected_warnings
+
+
+def test__read_and_validate_hierarchy_from_root__broken(tmp_path):
+    root_dir = tmp_path / "root"
+    root_dir.mkdir()
+    root_dir.joinpath("valid.frmb").write_text('{"name": "valid", "paths": ["p"]}')
+    valid_dir = root_dir / "valid"
+    valid_dir.mkdir()
+    invalid_json_path = valid_dir / "invalid-json.frmb"
+    invalid_json_path.write_text('{"name": "invalid"')
+    missing_name_path = valid_dir / "missing-name.frmb"
+    missing_name_path.write_text('{"command": ["cmd"]}')
+    missing_name_dir = valid_dir / "missing-name"
+    missing_name_dir.mkdir()
+    missing_name_dir.joinpath("hidden.frmb").write_text('{"name": "hidden"}')
+    valid_dir.joinpath("child.frmb").write_text('{"name": "child"}')
+
+    hierarchy, errors, warnings = read_and_validate_hierarchy_from_root(root_dir)
+    assert len(hierarchy) == 1
+    assert len(hierarchy[0].children) == 1
+    assert set(errors.keys()) == {invalid_json_path, missing_name_path}
+    assert list(warnings.keys()) == [missing_name_dir]
+
+    hierarchy, errors, warnings = read_and_validate_hierarchy_from_root(
+        root_dir, fail_fast=True
+    )
+    assert len(errors) == 1
+    assert list(errors.keys())[0] in (invalid_json_path, missing_name_path)
+
+
+def test__read_and_validate_hierarchy_from_root__show(data_dir):
+    structure1_dir = data_dir / "structure1"
+    structure1_show_dir = structure1_dir / "show"
+
+    hierarchy, errors, warnings = read_and_validate_hierarchy_from_root(
+        structure1_show_dir
+    )
+    assert len(errors) == 1
+    assert len(warnings) == 0
+
+    hierarchy, errors, warnings = read_and_validate_hierarchy_from_root(
+        structure1_show_dir, fail_fast=True
+    )
+    assert len(errors) == 1
+    assert "no paths specified" in list(errors.values())[0][0]
+
+
+def test__read_and_validate_hierarchy_from_root__nested(tmp_path):
+    root_dir = tmp_path / "root"
+    directory = root_dir
+    directory.mkdir()
+    directory.joinpath("0.frmb").write_text('{"name": "0", "paths": ["p"]}')
+    for i in range(1, 16):
+        directory = directory / f"{i - 1}"
+        directory.mkdir()
+        for sibling in ("a", "b"):
+            directory.joinpath(f"{i}{sibling}.frmb").write_text(f'{{"name": "{i}"}}')
+        directory.joinpath(f"{i}.frmb").write_text(f'{{"name": "{i}"}}')
+
+    hierarchy, errors, warnings = read_and_validate_hierarchy_from_root(root_dir)
+    expected_errors, expected_warnings = validate_entry_hierarchy(hierarchy)
+    assert len(errors) > 0
+    assert errors == expected_errors
+    assert warnings == expected_warnings
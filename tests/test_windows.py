@@ -1,5 +1,11 @@
+import pytest
+
 from frmb import read_hierarchy_from_root
+from frmb._windows import escape_windows_command
 from frmb._windows import generate_reg_from_hierarchy
+from frmb._windows import generate_reg_shards_from_hierarchy
+from frmb._windows import read_hierarchy_from_reg
+from frmb._windows import unescape_windows_command
 
 
 def test__generate_reg_from_hierarchy(data_dir):
@@ -30,3 +36,89 @@ def test__generate_reg_from_hierarchy__comments(data_dir):
     )
     result = [line for line in reg_content if line.lstrip("; ") in header_comments]
     assert len(result) == len(header_comments)
+
+
+def test__unescape_windows_command():
+    commands = [
+        ["cmd", "/k", '"C:\\some dir\\file.bat"', "%1", "1"],
+        ["python", "", "a b", "trailing\\", 'quote\\"d', "\\\\server\\share"],
+        [],
+    ]
+    for command in commands:
+        result = unescape_windows_command(escape_windows_command(command))
+        assert result == tuple(command)
+
+
+def test__read_hierarchy_from_reg(data_dir, tmp_path):
+    structure1_dir = data_dir / "structure1"
+    structure1_studio_dir = structure1_dir / "studio"
+    hierarchy = read_hierarchy_from_root(structure1_studio_dir)
+
+    for add_keys in (True, False):
+        reg_content = generate_reg_from_hierarchy(hierarchy, add_keys=add_keys)
+        result = read_hierarchy_from_reg(reg_content)
+        assert len(result) == 2
+        assert [entry.paths for entry in result] == [entry.paths for entry in hierarchy]
+        assert generate_reg_from_hierarchy(result, add_keys=add_keys) == reg_content
+
+    reg_path = tmp_path / "install.reg"
+    reg_content = generate_reg_from_hierarchy(hierarchy)
+    reg_path.write_text("\n".join(reg_content), encoding="utf-8")
+    with reg_path.open("r", encoding="utf-8") as reg_file:
+        result = read_hierarchy_from_reg(reg_file)
+
+    assert generate_reg_from_hierarchy(result) == reg_content
+    ffmpeg_entry = [entry for entry in result if entry.identifier == "FFMPEG"][0]
+    assert ffmpeg_entry.name == "Ffmpeg"
+    assert len(ffmpeg_entry.children) == 2
+    assert ffmpeg_entry.children[0].command[:2] == ("cmd", "/k")
+
+
+def test__generate_reg_shards_from_hierarchy(data_dir):
+    structure1_dir = data_dir / "structure1"
+    structure1_studio_dir = structure1_dir / "studio"
+    hierarchy = read_hierarchy_from_root(structure1_studio_dir)
+
+    shards = generate_reg_shards_from_hierarchy(hierarchy, shard_by="entry")
+    assert sorted(shards.keys()) == ["FFMPEG", "OIIO Tool"]
+
+    shards = generate_reg_shards_from_hierarchy(hierarchy, shard_by="path")
+    assert len(shards) == 5
+    assert all(not any(c in name for c in '\\/:*?"<>|[]') for name in shards)
+
+    # shards must cover the same keys as the monolithic file
+    expected = generate_reg_from_hierarchy(hierarchy)
+    expected = sorted(line for line in expected if line.startswith("["))
+    result = [line for shard in shards.values() for line in shard]
+    result = sorted(line for line in result if line.startswith("["))
+    assert result == expected
+
+    with pytest.raises(ValueError):
+        generate_reg_shards_from_hierarchy(hierarchy, shard_by="saucisse")
+
+
+def test__read_hierarchy_from_reg__exported():
+    reg_content = [
+        "Windows Registry Editor Version 5.00",
+        "",
+        "[HKEY_CURRENT_USER\\Software\\Classes\\*\\shell\\tool]",
+        '"MUIVERB"="Tool"',
+        '"Icon"="C:\\\\tool.ico"',
+        '"subCommands"=""',
+        "",
+        "[HKEY_CURRENT_USER\\Software\\Classes\\*\\shell\\tool\\shell\\run]",
+        '"muiverb"="Run"',
+        "[HKEY_CURRENT_USER\\Software\\Classes\\*\\shell\\tool\\shell\\run\\command]",
+        '@="tool.exe %1"',
+        "",
+        "[HKEY_CURRENT_USER\\Software\\Classes\\*\\shell\\other]",
+        '"MUIVerb"="Other"',
+        "[HKEY_CURRENT_USER\\Software\\Classes\\*\\shell\\other\\command]",
+        '@="other.exe"',
+    ]
+    result = read_hierarchy_from_reg(reg_content)
+    assert [entry.name for entry in result] == ["Tool", "Other"]
+    assert str(result[0].icon) == "C:\\tool.ico"
+    assert result[0].children[0].name == "Run"
+    assert result[0].children[0].command == ("tool.exe", "%1")
+    assert result[1].command == ("other.exe",)